@@ -1,10 +1,19 @@
 import os
+import shutil
+import subprocess
 from pathlib import Path
 
 import click
 
 cwd = Path(__file__).parent
 
+DOCS_SOURCE = os.fspath(cwd / "docs" / "source")
+DOCS_API = os.fspath(cwd / "docs" / "source" / "api")
+DOCS_BUILD = os.fspath(cwd / "docs" / "build")
+DOCS_INDEX = os.fspath(cwd / "docs" / "build" / "html" / "index.html")
+SRC = os.fspath(cwd / "src")
+EXAMPLES = cwd / "examples"
+
 
 @click.group()
 def main():
@@ -13,22 +22,27 @@ def main():
 
 @main.command()
 @click.option("--make", is_flag=True, help="make docs")
+@click.option("--clean", is_flag=True, help="remove previous build before making docs")
 @click.option("--open", is_flag=True, help="open docs")
-def docs(make, open):
+def docs(make, clean, open):
+    if clean:
+        shutil.rmtree(DOCS_BUILD, ignore_errors=True)
     if make:
-        os.system(f"rm -rf {cwd}/docs/build/")
-        os.system(f"sphinx-apidoc -o {cwd}/docs/source/api {cwd}/src/")
-        os.system(f"sphinx-build -M html {cwd}/docs/source/ {cwd}/docs/build/")
+        subprocess.run(["sphinx-apidoc", "--force", "-o", DOCS_API, SRC], check=True)
+        subprocess.run(
+            ["sphinx-build", "-M", "html", DOCS_SOURCE, DOCS_BUILD, "-j", "auto"],
+            check=True,
+        )
     if open:
-        index = f"{cwd}/docs/build/html/index.html"
-        os.system(f"open {index}")
+        subprocess.run(["open", DOCS_INDEX], check=True)
 
 
 @main.command()
 @click.argument("name", default="html_basic_demo")
 def run(name: str):
-    # runs demo
-    os.system(f"uv run {cwd}/examples/{name}.py")
+    # runs demo as a module from the examples dir, so its package imports work
+    module = name.removesuffix(".py").replace("/", ".")
+    subprocess.run(["uv", "run", "python", "-m", module], check=True, cwd=EXAMPLES)
 
 
 if __name__ == "__main__":
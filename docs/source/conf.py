@@ -14,13 +14,12 @@ author = "Yasas Senarath"
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    "sphinx.ext.duration",
-    "sphinx.ext.doctest",
     "sphinx.ext.autodoc",
 ]
 
 templates_path = ["_templates"]
-exclude_patterns = []
+# modules.rst is generated by sphinx-apidoc but not part of any toctree
+exclude_patterns = ["api/modules.rst"]
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -1,6 +1,11 @@
 """Demonstration of the new html_v2 module with type-safe elements."""
 
-from flask import Flask
+import functools
+import gzip
+from http import HTTPStatus
+
+from flask import Flask, request
+from markupsafe import Markup
 
 import viol
 from viol import BasicLayout, html, render
@@ -16,11 +21,9 @@ app = Flask(__name__)
 
 viol.init_app(app)
 
-
-@app.route("/")
-def home():
-    # Create a container with proper typing
-    body = [
+# static fragments are rendered once at import
+NAVBAR_HTML = Markup(
+    render(
         simple_navbar(
             items=[
                 {"name": "Accordion", "href": "/accordion"},
@@ -29,7 +32,110 @@ def home():
                 # badge
                 {"name": "Badges", "href": "/badges"},
             ]
-        ),
+        )
+    )
+)
+
+ACCORDION_HTML = Markup(render(sample_accordion()))
+
+ALERT_VARIANTS = (
+    "primary",
+    "secondary",
+    "success",
+    "danger",
+    "warning",
+    "info",
+    "light",
+    "dark",
+)
+
+ALERTS_HTML = Markup(
+    render(
+        html.div(
+            [
+                Alert(
+                    f"This is {'an' if variant[0] in 'aeiou' else 'a'} {variant} alert!",
+                    variant=variant,
+                )
+                for variant in ALERT_VARIANTS
+            ],
+            attrs={"class": ["container"]},
+        )
+    )
+)
+
+BADGES_HTML = Markup(
+    render(
+        html.div(
+            [
+                html.h1(["Example heading ", Badge("New", bg_color="secondary")]),
+                html.h2(["Example heading ", Badge("New", bg_color="secondary")]),
+                html.h3(["Example heading ", Badge("New", bg_color="secondary")]),
+                html.h4(["Example heading ", Badge("New", bg_color="secondary")]),
+                html.h5(["Example heading ", Badge("New", bg_color="secondary")]),
+                html.h6(["Example heading ", Badge("New", bg_color="secondary")]),
+                Button(
+                    [
+                        "Notifications ",
+                        Badge(
+                            "4",
+                            bg_color="secondary",
+                            attrs={
+                                "class": [
+                                    "position-absolute",
+                                    "top-0",
+                                    "start-100",
+                                    "translate-middle",
+                                ]
+                            },
+                        ),
+                    ],
+                    color="primary",
+                ),
+                Button(
+                    ["Inbox ", Badge("99+", bg_color="danger")],
+                    color="primary",
+                    attrs={"class": ["position-relative"]},
+                ),
+            ],
+            attrs={"class": ["container"]},
+        )
+    )
+)
+
+
+@functools.lru_cache(maxsize=64)
+def gzip_compress(data: bytes) -> bytes:
+    # mtime=0 keeps the output, and so its ETag, stable across calls
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+@app.after_request
+def compress_and_tag(response):
+    # every page is a pure function of its path, so let browsers revalidate
+    if (
+        request.method == "GET"
+        and response.status_code == HTTPStatus.OK
+        and not response.direct_passthrough
+    ):
+        response.vary.add("Accept-Encoding")
+        # "gzip;q=0" means refused, and never compress a body twice
+        if (
+            request.accept_encodings["gzip"] > 0
+            and "Content-Encoding" not in response.headers
+        ):
+            response.set_data(gzip_compress(response.get_data()))
+            response.headers["Content-Encoding"] = "gzip"
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+
+@app.route("/")
+def home():
+    # Create a container with proper typing
+    body = [
+        NAVBAR_HTML,
         html.div(
             [
                 simple_breadcrumb(),
@@ -45,65 +151,17 @@ def home():
 
 @app.route("/accordion")
 def about_page():
-    example = sample_accordion()
     bed = simple_breadcrumb()
-    return render([bed, example])
+    return render([bed, ACCORDION_HTML])
 
 
 @app.route("/alerts")
 def alerts_page():
-    example = html.div(
-        [
-            Alert("This is a primary alert!", variant="primary"),
-            Alert("This is a secondary alert!", variant="secondary"),
-            Alert("This is a success alert!", variant="success"),
-            Alert("This is a danger alert!", variant="danger"),
-            Alert("This is a warning alert!", variant="warning"),
-            Alert("This is an info alert!", variant="info"),
-            Alert("This is a light alert!", variant="light"),
-            Alert("This is a dark alert!", variant="dark"),
-        ],
-        attrs={"class": ["container"]},
-    )
     bed = simple_breadcrumb()
-    return render([bed, example])
+    return render([bed, ALERTS_HTML])
 
 
 @app.route("/badges")
 def badges_page():
-    example = html.div(
-        [
-            html.h1(["Example heading ", Badge("New", bg_color="secondary")]),
-            html.h2(["Example heading ", Badge("New", bg_color="secondary")]),
-            html.h3(["Example heading ", Badge("New", bg_color="secondary")]),
-            html.h4(["Example heading ", Badge("New", bg_color="secondary")]),
-            html.h5(["Example heading ", Badge("New", bg_color="secondary")]),
-            html.h6(["Example heading ", Badge("New", bg_color="secondary")]),
-            Button(
-                [
-                    "Notifications ",
-                    Badge(
-                        "4",
-                        bg_color="secondary",
-                        attrs={
-                            "class": [
-                                "position-absolute",
-                                "top-0",
-                                "start-100",
-                                "translate-middle",
-                            ]
-                        },
-                    ),
-                ],
-                color="primary",
-            ),
-            Button(
-                ["Inbox ", Badge("99+", bg_color="danger")],
-                color="primary",
-                attrs={"class": ["position-relative"]},
-            ),
-        ],
-        attrs={"class": ["container"]},
-    )
     bed = simple_breadcrumb()
-    return render([bed, example])
+    return render([bed, BADGES_HTML])
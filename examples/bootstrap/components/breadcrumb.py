@@ -1,19 +1,22 @@
+import functools
+
 from flask import request
 
 from viol.bootstrap.breadcrumb import Breadcrumb
 
 
+@functools.lru_cache(maxsize=256)
+def breadcrumb_for(path: str) -> Breadcrumb:
+    """Create the breadcrumb navigation for a request path."""
+    parts = [part for part in path.strip("/").split("/") if part]
+    location = [("Home", "/")]
+    prefix = ""
+    for part in parts:
+        prefix += f"/{part}"
+        location.append((part.capitalize(), prefix))
+    return Breadcrumb(location=location, attrs={"class": ["my-3"]})
+
+
 def simple_breadcrumb() -> Breadcrumb:
     """Create a simple breadcrumb navigation."""
-    request_path = request.path.strip("/").split("/")
-    return Breadcrumb(
-        location=[
-            ("Home", "/"),
-            *[
-                (part.capitalize(), f"/{'/'.join(request_path[: i + 1])}")
-                for i, part in enumerate(request_path)
-                if part
-            ],
-        ],
-        attrs={"class": ["my-3"]},
-    )
+    return breadcrumb_for(request.path)
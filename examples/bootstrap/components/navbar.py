@@ -1,4 +1,4 @@
-from collections.abc import Iterator
+import functools
 
 from viol.bootstrap.navbar import (
     Navbar,
@@ -15,12 +15,9 @@ __all__ = [
 ]
 
 
-def validate_each(items: list[dict]) -> Iterator[tuple[int, dict]]:
-    """Validate each item in the list and yield valid items."""
-    for i, item in enumerate(items):
-        if isinstance(item, str):
-            yield {"name": item}
-        yield i, item
+def validate_each(items: list[dict]) -> list[dict]:
+    """Validate each item in the list, turning bare names into items."""
+    return [{"name": item} if isinstance(item, str) else item for item in items]
 
 
 def simple_navbar(
@@ -31,6 +28,30 @@ def simple_navbar(
     target: str = "#main-content",
 ) -> Navbar:
     """Create a complex Bootstrap navbar with brand and toggler."""
+    items_key = tuple(
+        (
+            item["name"],
+            item.get("href", "#"),
+            item.get("active", False),
+            item.get("disabled", False),
+        )
+        for item in validate_each(items)
+    )
+    return build_navbar(items_key, id, brand, brand_href, target)
+
+
+@functools.lru_cache(maxsize=64)
+def build_navbar(
+    items: tuple[tuple[str, str, bool, bool], ...],
+    id: str,
+    brand: str,
+    brand_href: str,
+    target: str,
+) -> Navbar:
+    """Build (and cache) a navbar from hashable (name, href, active, disabled) items."""
+    hyperscript = (
+        f'on click remove .active from <#{id} a[id^="navbar-link-"]/> add .active'
+    )
     return Navbar(
         [
             NavbarBrand(brand, brand_href),
@@ -42,22 +63,24 @@ def simple_navbar(
                             *[
                                 NavItem(
                                     NavLink(
-                                        item["name"],
-                                        active=item.get("active", False),
-                                        disabled=item.get("disabled", False),
+                                        name,
+                                        active=active,
+                                        disabled=disabled,
                                         events=[
                                             {
                                                 "method": "get",
-                                                "rule": item["href"],
+                                                "rule": href,
                                                 "trigger": "click",
                                                 "target": target,
                                             }
                                         ],
                                         id=f"navbar-link-{i}",
-                                        hyperscript=f'on click remove .active from <#{id} a[id^="navbar-link-"]/> add .active',
+                                        hyperscript=hyperscript,
                                     )
                                 )
-                                for i, item in validate_each(items)
+                                for i, (name, href, active, disabled) in enumerate(
+                                    items
+                                )
                             ]
                         ],
                     )
@@ -1,9 +1,6 @@
-import sys
-from pathlib import Path
+import os
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from bootstrap.app import app
+from .app import app
 
 if __name__ == "__main__":
-    app.run(port=8000, debug=True)
+    app.run(port=8000, debug=os.environ.get("VIOL_DEBUG") == "1")
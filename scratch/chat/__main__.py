@@ -1,5 +1,7 @@
 """Demonstration of the new html_v2 module with type-safe elements."""
 
+import functools
+import os
 import uuid
 from pathlib import Path
 
@@ -23,6 +25,33 @@ DATABASE = Path(__file__).parent / "sessions.db"
 
 models.init_app(app, DATABASE)
 
+SUBMIT_RESPONSE = render(
+    html.div(
+        [
+            html.span(
+                "Assistant",
+                attrs={"class": "role"},
+            ),
+            html.span(
+                "Hello!",
+                attrs={"class": "content"},
+            ),
+        ],
+        attrs={"class": "chatHistoryItem"},
+    ),
+)
+
+
+@functools.cache
+def submit_url() -> str:
+    # the submit route is static, resolve it once
+    return url_for("submit")
+
+
+@functools.cache
+def chat_script_url() -> str:
+    return url_for("static", filename="chat.js")
+
 
 @app.route("/")
 def chat():
@@ -55,7 +84,7 @@ def chat():
                     events=[
                         {
                             "method": "get",
-                            "rule": url_for("submit"),
+                            "rule": submit_url(),
                             "trigger": "click",
                             "target": "#chatHistory",
                             "swap": "beforeend transition:true",
@@ -67,48 +96,15 @@ def chat():
             ],
             attrs={"class": "container"},
         ),
-        html.script("""
-function extractHistoryItem(item) {
-    return {
-        role: item.querySelector('.role').textContent,
-        content: item.querySelector('.content').textContent
-    };
-}
-
-function getChatHistory() {
-    // add the last line to get the chat history
-    let chatHistory = document.querySelector('#chatHistory');
-    // add the last line to get the chat history
-    let values = document.querySelectorAll('#chatHistory .chatHistoryItem');
-    let history = [];
-    if (values) {
-        history = Array.from(values).map(extractHistoryItem);
-    }
-    return history;
-}
-"""),
+        html.script(attrs={"src": chat_script_url()}),
     ]
     return render(BasicLayout(body=body))
 
 
 @app.route("/submit", methods=["GET"])
 def submit():
-    return render(
-        html.div(
-            [
-                html.span(
-                    "Assistant",
-                    attrs={"class": "role"},
-                ),
-                html.span(
-                    "Hello!",
-                    attrs={"class": "content"},
-                ),
-            ],
-            attrs={"class": "chatHistoryItem"},
-        ),
-    )
+    return SUBMIT_RESPONSE
 
 
 if __name__ == "__main__":
-    app.run(port=8000, debug=True)
+    app.run(port=8000, debug=os.environ.get("VIOL_DEBUG") == "1")
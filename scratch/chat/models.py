@@ -1,8 +1,9 @@
+import sqlite3
 from pathlib import Path
 
-from flask import Flask
+from flask import Flask, current_app, has_app_context
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, event
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -14,6 +15,35 @@ class Base(DeclarativeBase):
 db = SQLAlchemy(model_class=Base)
 
 
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+    # commits no longer fsync the main database file every time
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-8000")
+    cursor.close()
+
+
+# Werkzeug's own default
+DEFAULT_PASSWORD_HASH_METHOD = "scrypt"
+
+
+def password_hash_method() -> str:
+    # the hashing cost is the bulk of a register/update request, let the app
+    # config pick the method (e.g. "scrypt:16384:8:1" or "pbkdf2:sha256:100000");
+    # outside an app (scripts, tests) fall back to the default
+    if not has_app_context():
+        return DEFAULT_PASSWORD_HASH_METHOD
+    return current_app.config.get("PASSWORD_HASH_METHOD", DEFAULT_PASSWORD_HASH_METHOD)
+
+
+def hash_password(password: str) -> str:
+    return generate_password_hash(password, method=password_hash_method())
+
+
 class User(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True)
     username: Mapped[str] = mapped_column(unique=True, nullable=False)
@@ -21,14 +51,14 @@ class User(db.Model):
     email: Mapped[str | None] = mapped_column(unique=True, nullable=True)
 
     def __init__(self, username: str, password: str, email: str | None = None):
-        password_hash = generate_password_hash(password)
+        password_hash = hash_password(password)
         super().__init__(username=username, password_hash=password_hash, email=email)
 
     def __repr__(self):
         return f"<User {self.username}>"
 
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hash_password(password)
 
     def check_password(self, password: str) -> bool:
         return check_password_hash(self.password_hash, password)
@@ -42,9 +72,13 @@ class Message(db.Model):
     receiver_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     parent_id: Mapped[int] = mapped_column(ForeignKey("message.id"))
 
-    sender = db.relationship("User", foreign_keys=[sender_id])
-    receiver = db.relationship("User", foreign_keys=[receiver_id])
-    parent = db.relationship("Message", foreign_keys=[parent_id])
+    # listing messages always shows who sent/received them, load those in one
+    # batched IN query per relationship instead of a query per message
+    sender = db.relationship("User", foreign_keys=[sender_id], lazy="selectin")
+    receiver = db.relationship("User", foreign_keys=[receiver_id], lazy="selectin")
+    parent = db.relationship(
+        "Message", foreign_keys=[parent_id], remote_side=[id], lazy="selectin"
+    )
 
     def __repr__(self):
         return f"<Message {self.id}"
@@ -55,9 +89,23 @@ def init_app(app: Flask, path: str | Path) -> SQLAlchemy:
     if isinstance(path, Path):
         path = Path(path)
     app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    app.config.setdefault("PASSWORD_HASH_METHOD", DEFAULT_PASSWORD_HASH_METHOD)
+    # keep a pool of connections around instead of reconnecting per request,
+    # and cheaply check them before use so a stale one is replaced
+    app.config.setdefault(
+        "SQLALCHEMY_ENGINE_OPTIONS",
+        {
+            "pool_pre_ping": True,
+            "pool_size": 10,
+            "max_overflow": 20,
+            "connect_args": {"check_same_thread": False},
+        },
+    )
     # initialize the app with the extension
     db.init_app(app)
-    if not path.exists():
-        # create the database if it does
-        with app.app_context():
+    with app.app_context():
+        # only this app's engine, other engines in the process keep their settings
+        event.listen(db.engine, "connect", set_sqlite_pragma)
+        if not path.exists():
+            # create the database if it does
             db.create_all()
@@ -0,0 +1,18 @@
+function extractHistoryItem(item) {
+    return {
+        role: item.querySelector('.role').textContent,
+        content: item.querySelector('.content').textContent
+    };
+}
+
+function getChatHistory() {
+    // add the last line to get the chat history
+    let chatHistory = document.querySelector('#chatHistory');
+    // add the last line to get the chat history
+    let values = document.querySelectorAll('#chatHistory .chatHistoryItem');
+    let history = [];
+    if (values) {
+        history = Array.from(values).map(extractHistoryItem);
+    }
+    return history;
+}
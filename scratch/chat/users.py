@@ -1,31 +1,46 @@
+import functools
 import json
 
 from flask import Blueprint, make_response, request, session, url_for
+from sqlalchemy import select
+from werkzeug.security import check_password_hash, generate_password_hash
 
 from viol import BasicLayout, html, render
 
-from .models import User, db
+from .models import User, db, password_hash_method
 
 app = Blueprint("users", __name__)
 
+
+@functools.cache
+def users_url(endpoint: str) -> str:
+    # the users routes take no arguments, resolve each one once
+    return url_for(f"users.{endpoint}")
+
+
+@functools.cache
+def dummy_password_hash(method: str) -> str:
+    # checked against when the username is unknown, so a failed login takes as
+    # long whether or not the user exists
+    return generate_password_hash("dummy-password", method=method)
+
+
 ALERT_LEVELS = {
-    "primary",
-    "secondary",
-    "success",
-    "danger",
-    "warning",
-    "info",
-    "light",
-    "dark",
+    "primary": "primary",
+    "secondary": "secondary",
+    "success": "success",
+    "danger": "danger",
+    "warning": "warning",
+    "info": "info",
+    "light": "light",
+    "dark": "dark",
+    # aliases
+    "error": "danger",
 }
 
 
-def validate_alert_level(level: str) -> bool:
-    if level.lower() == "error":
-        level = "danger"
-    if level.lower() in ALERT_LEVELS:
-        return level.lower()
-    return "info"
+def validate_alert_level(level: str) -> str:
+    return ALERT_LEVELS.get(level.lower(), "info")
 
 
 def alert(trigger: dict | str) -> str:
@@ -46,25 +61,9 @@ def alert(trigger: dict | str) -> str:
     return resp
 
 
-@app.route("/users/register", methods=["GET", "POST"])
-def register_user():
-    if request.method == "POST":
-        trigger = None
-        username = request.form["username"]
-        password = request.form["password"]
-        try:
-            user = User(username=username, password=password)
-            db.session.add(user)
-            db.session.commit()
-            # return "User registered"
-            trigger = {"level": "success", "message": "User registered"}
-        except Exception as e:
-            db.session.rollback()
-            if "UNIQUE constraint failed: user.username" in str(e):
-                trigger = {"level": "error", "message": "User already exists"}
-            else:
-                trigger = {"level": "error", "message": "Error registering user"}
-        return alert(trigger)
+@functools.cache
+def register_page() -> str:
+    # the form is the same for every visitor, render it once
     return render(
         BasicLayout(
             body=[
@@ -92,7 +91,7 @@ def register_user():
                     events=[
                         {
                             "method": "post",
-                            "rule": url_for("users.register_user"),
+                            "rule": users_url("register_user"),
                             "trigger": "submit",
                             "target": "body",
                             "swap": "none",
@@ -105,6 +104,28 @@ def register_user():
     )
 
 
+@app.route("/users/register", methods=["GET", "POST"])
+def register_user():
+    if request.method == "POST":
+        trigger = None
+        username = request.form["username"]
+        password = request.form["password"]
+        try:
+            user = User(username=username, password=password)
+            db.session.add(user)
+            db.session.commit()
+            # return "User registered"
+            trigger = {"level": "success", "message": "User registered"}
+        except Exception as e:
+            db.session.rollback()
+            if "UNIQUE constraint failed: user.username" in str(e):
+                trigger = {"level": "error", "message": "User already exists"}
+            else:
+                trigger = {"level": "error", "message": "Error registering user"}
+        return alert(trigger)
+    return register_page()
+
+
 @app.route("/users/profile", methods=["GET", "POST"])
 def show_profile():
     user_id = session.get("user_id", None)
@@ -112,7 +133,7 @@ def show_profile():
     if user_id is None:
         trigger = {"level": "error", "message": "User not logged in"}
     else:
-        user: User | None = User.query.get(user_id)
+        user: User | None = db.session.get(User, user_id)
         if user is None:
             trigger = {"level": "error", "message": "User not found"}
         elif request.method == "POST":
@@ -174,7 +195,7 @@ def show_profile():
                     events=[
                         {
                             "method": "post",
-                            "rule": url_for("users.show_profile"),
+                            "rule": users_url("show_profile"),
                             "trigger": "submit",
                             "target": "body",
                             "swap": "none",
@@ -193,28 +214,9 @@ def logout_user():
     return alert({"level": "success", "message": "User logged out"})
 
 
-@app.route("/users/login", methods=["GET", "POST"])
-def login_user():
-    if request.method == "POST":
-        trigger = None
-        username = request.form["username"]
-        password = request.form["password"]
-        user: User | None = User.query.filter_by(username=username).first()
-        if isinstance(user, User):
-            if user.check_password(password):
-                session["user_id"] = user.id
-                # return "User logged in: " + user.username
-                trigger = {
-                    "level": "success",
-                    "message": "User logged in: " + user.username,
-                }
-            else:
-                # return "Invalid credentials"
-                trigger = {"level": "error", "message": "Invalid credentials"}
-        else:
-            trigger = {"level": "error", "message": "User not found"}
-        if trigger:
-            return alert(trigger)
+@functools.cache
+def login_page() -> str:
+    # the form is the same for every visitor, render it once
     return render(
         BasicLayout(
             body=[
@@ -242,7 +244,7 @@ def login_user():
                     events=[
                         {
                             "method": "post",
-                            "rule": url_for("users.login_user"),
+                            "rule": users_url("login_user"),
                             "trigger": "submit",
                             "target": "body",
                             "swap": "none",
@@ -255,17 +257,55 @@ def login_user():
     )
 
 
+@app.route("/users/login", methods=["GET", "POST"])
+def login_user():
+    if request.method == "POST":
+        trigger = None
+        username = request.form["username"]
+        password = request.form["password"]
+        user: User | None = User.query.filter_by(username=username).first()
+        if isinstance(user, User):
+            if user.check_password(password):
+                session["user_id"] = user.id
+                # return "User logged in: " + user.username
+                trigger = {
+                    "level": "success",
+                    "message": "User logged in: " + user.username,
+                }
+            else:
+                # return "Invalid credentials"
+                trigger = {"level": "error", "message": "Invalid credentials"}
+        else:
+            check_password_hash(dummy_password_hash(password_hash_method()), password)
+            trigger = {"level": "error", "message": "User not found"}
+        if trigger:
+            return alert(trigger)
+    return login_page()
+
+
+USERS_PAGE_SIZE = 50
+USERS_MAX_PAGE_SIZE = 500
+# keeps page * size well inside SQLite's 64-bit INTEGER offset
+USERS_MAX_PAGE = 10**9
+
+
 @app.route("/users", methods=["GET"])
 def show_users():
+    # only one page of usernames is ever loaded, ?page=N&size=K picks which
+    page = request.args.get("page", 0, type=int)
+    page = min(max(page, 0), USERS_MAX_PAGE)
+    size = request.args.get("size", USERS_PAGE_SIZE, type=int)
+    size = min(max(size, 1), USERS_MAX_PAGE_SIZE)
+    stmt = select(User.username).order_by(User.id).limit(size).offset(page * size)
     return render(
         BasicLayout(
             body=[
-                html.a("Register", attrs={"href": url_for("users.register_user")}),
-                html.a("Login", attrs={"href": url_for("users.login_user")}),
-                html.a("Profile", attrs={"href": url_for("users.show_profile")}),
-                html.a("Logout", attrs={"href": url_for("users.logout_user")}),
+                html.a("Register", attrs={"href": users_url("register_user")}),
+                html.a("Login", attrs={"href": users_url("login_user")}),
+                html.a("Profile", attrs={"href": users_url("show_profile")}),
+                html.a("Logout", attrs={"href": users_url("logout_user")}),
                 html.h1("Users"),
-                html.ul([html.li(user.username) for user in User.query.all()]),
+                html.ul([html.li(username) for username in db.session.scalars(stmt)]),
             ]
         )
     )
@@ -1,5 +1,8 @@
 """Demonstration of the new html_v2 module with type-safe elements."""
 
+import os
+from types import MappingProxyType
+
 from flask import Flask, url_for
 
 import viol
@@ -9,6 +12,8 @@ app = Flask(__name__)
 
 viol.init_app(app)
 
+BTN_PRIMARY_ATTRS = MappingProxyType({"class": "btn btn-primary"})
+
 
 @app.route("/")
 def home():
@@ -58,9 +63,7 @@ def home():
             ),
             html.button(
                 "Click me",
-                attrs={
-                    "class": "btn btn-primary",
-                },
+                attrs=BTN_PRIMARY_ATTRS,
                 events=[
                     {
                         "method": "get",
@@ -91,4 +94,4 @@ def submit2():
 
 
 if __name__ == "__main__":
-    app.run(port=8000, debug=True)
+    app.run(port=8000, debug=os.environ.get("VIOL_DEBUG") == "1")
@@ -1,5 +1,7 @@
 """Demonstration of the new html_v2 module with type-safe elements."""
 
+import os
+
 from accordion import sample_accordion
 from flask import Flask
 from navbar import simple_navbar
@@ -14,32 +16,33 @@ app = Flask(__name__)
 viol.init_app(app)
 
 
-@app.route("/")
-def home():
-    # Create a container with proper typing
-    body = [
-        simple_navbar(),
-        html.div(
-            Breadcrumb(
-                [("Home", "/"), ("Library", "/library"), "Data"],
-            ),
-            attrs={"class": "container py-3"},
-        ),
-        html.div(
-            sample_accordion(),
-            attrs={"class": "container"},
+# the page body does not depend on the request, so it is built once
+BODY = (
+    simple_navbar(),
+    html.div(
+        Breadcrumb(
+            [("Home", "/"), ("Library", "/library"), "Data"],
         ),
-        html.h1(
-            [
-                "Hello, World!",
-                Badge("New"),
-            ],
-            attrs={"class": "text-center"},
-        ),
-    ]
+        attrs={"class": "container py-3"},
+    ),
+    html.div(
+        sample_accordion(),
+        attrs={"class": "container"},
+    ),
+    html.h1(
+        [
+            "Hello, World!",
+            Badge("New"),
+        ],
+        attrs={"class": "text-center"},
+    ),
+)
+
 
-    return render(BasicLayout(body=body))
+@app.route("/")
+def home():
+    return render(BasicLayout(body=BODY))
 
 
 if __name__ == "__main__":
-    app.run(port=8000, debug=True)
+    app.run(port=8000, debug=os.environ.get("VIOL_DEBUG") == "1")
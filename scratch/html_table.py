@@ -1,75 +1,96 @@
 """Demonstration of the new html_v2 module with type-safe elements."""
 
-from flask import Flask, request, session, url_for
+import functools
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+
+from flask import (
+    Flask,
+    Response,
+    make_response,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
+from markupsafe import Markup, escape
 
 import viol
 from viol import BasicLayout, html, render
 
 app = Flask(__name__)
 app.secret_key = "some_secret"  # Required for sessions
+# contacts are kept keyed by email, don't let the session cookie reorder them
+app.json.sort_keys = False
 
 
 viol.init_app(app)
 
 
-@app.route("/")
-def home():
-    # Initialize contacts in session if not already present
-    if "contacts" not in session:
-        session["contacts"] = [
-            {"name": "John Doe", "email": "john.doe@example.com"},
-            {"name": "Jane Smith", "email": "jane.smith@example.com"},
-        ]
+ROWS_PLACEHOLDER = Markup("<!-- contact rows -->")
+
+
+@functools.lru_cache(maxsize=1024)
+def delete_url(email: str) -> str:
+    # rows are re-rendered on every change, build (and escape) each
+    # contact's url once
+    return str(escape(url_for("delete_user", email=email)))
+
+
+def make_contact(name: str, email: str) -> dict:
+    # contacts are stored already escaped, rows insert them as-is
+    return {"name": str(escape(name)), "email": str(escape(email))}
+
+
+ROW_TEMPLATE = (
+    "<tr><td>{name}</td> <td>{email}</td> <td>"
+    '<button class="btn btn-danger" hx-delete="{url}"'
+    ' hx-target="closest tr" hx-swap="outerHTML">Delete</button>'
+    "</td></tr>"
+)
+
 
+def iter_rows(contacts: dict[str, dict]) -> Iterator[str]:
+    # rows are plain string substitution, no element tree per contact
+    for email, contact in contacts.items():
+        yield ROW_TEMPLATE.format(
+            name=contact["name"],
+            email=contact["email"],
+            url=delete_url(email),
+        )
+
+
+def render_rows(contacts: dict[str, dict]) -> str:
+    return "".join(iter_rows(contacts))
+
+
+@functools.cache
+def home_shell():
+    # everything but the table rows is static, so render the page once and
+    # split it around the rows
     body = [
         html.div(
             [
-                html.h1(["HTML Dynamic Add/Remove Demo"], attrs={"class": "title"}),
+                html.h1("HTML Dynamic Add/Remove Demo", attrs={"class": "title"}),
                 html.div(
                     [
                         html.h2("Contacts"),
                         html.table(
                             [
                                 html.thead(
-                                    [
-                                        html.tr(
-                                            [
-                                                html.th("Name"),
-                                                html.th("Email"),
-                                                html.th("Actions"),
-                                            ]
-                                        )
-                                    ]
+                                    html.tr(
+                                        [
+                                            html.th("Name"),
+                                            html.th("Email"),
+                                            html.th("Actions"),
+                                        ]
+                                    )
                                 ),
                                 html.tbody(
                                     id="contacts-table",
-                                    children=[
-                                        html.tr(
-                                            [
-                                                html.td([contact["name"]]),
-                                                html.td([contact["email"]]),
-                                                html.td(
-                                                    [
-                                                        html.button(
-                                                            "Delete",
-                                                            attrs={
-                                                                "class": "btn btn-danger",
-                                                                "hx-delete": url_for(
-                                                                    "delete_user",
-                                                                    email=contact[
-                                                                        "email"
-                                                                    ],
-                                                                ),
-                                                                "hx-target": "#contacts-table",
-                                                                "hx-swap": "innerHTML",
-                                                            },
-                                                        )
-                                                    ]
-                                                ),
-                                            ]
-                                        )
-                                        for contact in session["contacts"]
-                                    ],
+                                    children=ROWS_PLACEHOLDER,
                                 ),
                             ],
                             attrs={"class": "table"},
@@ -130,7 +151,51 @@ def home():
         ),
     ]
 
-    return render(BasicLayout(body=body))
+    page = render(BasicLayout(body=body))
+    head, _, tail = page.partition(ROWS_PLACEHOLDER)
+    return head, tail
+
+
+def stream_page(head: str, contacts: dict[str, dict], tail: str) -> Iterator[str]:
+    # send the shell straight away, then the rows as they are formatted
+    yield head
+    yield from iter_rows(contacts)
+    yield tail
+
+
+def get_contacts() -> dict[str, dict]:
+    # Initialize contacts in session if not already present, or if the cookie
+    # still holds the older list of contacts
+    if not isinstance(session.get("contacts"), dict):
+        # keyed by email, so deletes are a dict pop instead of a scan
+        session["contacts"] = {
+            "john.doe@example.com": make_contact("John Doe", "john.doe@example.com"),
+            "jane.smith@example.com": make_contact(
+                "Jane Smith", "jane.smith@example.com"
+            ),
+        }
+    return session["contacts"]
+
+
+@app.route("/")
+def home():
+    contacts = get_contacts()
+    head, tail = home_shell()
+    # the page only changes with the contacts, so tag it with their hash and
+    # skip rendering altogether when the browser already has it
+    digest = hashlib.blake2b(head.encode(), digest_size=8)
+    digest.update(json.dumps(contacts).encode())
+    etag = digest.hexdigest()
+    if request.if_none_match.contains(etag):
+        response = make_response("", 304)
+    else:
+        response = Response(
+            stream_with_context(stream_page(head, contacts, tail)),
+            mimetype="text/html",
+        )
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
 
 
 @app.route("/user/add", methods=["POST"])
@@ -138,73 +203,23 @@ def add_user():
     data = dict(request.form)
     name = data.get("name")
     email = data.get("email")
-    contacts = session["contacts"]
-    contacts.append({"name": name, "email": email})
+    if not name or not email:
+        return "Name and email are required", 400
+    contacts = get_contacts()
+    contacts[email] = make_contact(name, email)
     session["contacts"] = contacts
-    contacts = session["contacts"]
-    items = [
-        html.tr(
-            [
-                html.td([contact["name"]]),
-                html.td([contact["email"]]),
-                html.td(
-                    [
-                        html.button(
-                            "Delete",
-                            attrs={
-                                "class": "btn btn-danger",
-                                "hx-delete": url_for(
-                                    "delete_user", email=contact["email"]
-                                ),
-                                "hx-target": "#contacts-table",
-                                "hx-swap": "innerHTML",
-                            },
-                        )
-                    ]
-                ),
-            ]
-        )
-        for contact in contacts
-    ]
-    return render(items)
+    return render_rows(contacts)
 
 
 @app.route("/user/delete/<email>", methods=["DELETE"])
 def delete_user(email: str):
-    contacts = session["contacts"]
-    contact_to_delete = next(
-        (contact for contact in contacts if contact["email"] == email), None
-    )
-    if contact_to_delete:
-        contacts.remove(contact_to_delete)
+    contacts = get_contacts()
+    if contacts.pop(email, None) is not None:
         session["contacts"] = contacts
-    contacts = session["contacts"]
-    items = [
-        html.tr(
-            [
-                html.td([contact["name"]]),
-                html.td([contact["email"]]),
-                html.td(
-                    [
-                        html.button(
-                            "Delete",
-                            attrs={
-                                "class": "btn btn-danger",
-                                "hx-delete": url_for(
-                                    "delete_user", email=contact["email"]
-                                ),
-                                "hx-target": "#contacts-table",
-                                "hx-swap": "innerHTML",
-                            },
-                        )
-                    ]
-                ),
-            ]
-        )
-        for contact in contacts
-    ]
-    return render(items)
+    # the button swaps its own row out, an empty body removes it; htmx
+    # ignores 204 responses, so this stays a 200
+    return ""
 
 
 if __name__ == "__main__":
-    app.run(port=8000, debug=True)
+    app.run(port=8000, debug=os.environ.get("VIOL_DEBUG") == "1")
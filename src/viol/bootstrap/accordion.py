@@ -43,7 +43,7 @@ class Accordion(Element):
         if value:
             if "accordion-flush" in self.attrs["class"]:
                 return
-            self.attrs["class"] += "accordion-flush"
+            self.attrs["class"].append("accordion-flush")
         elif "accordion-flush" in self.attrs["class"]:
             while "accordion-flush" in self.attrs["class"]:
                 self.attrs["class"].remove("accordion-flush")
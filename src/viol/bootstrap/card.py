@@ -16,8 +16,16 @@ class Card(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        children = []
+        if header:
+            children.append(CardHeader(header))
+        if body:
+            children.append(CardBody(body))
+        if footer:
+            children.append(CardFooter(footer))
         super().__init__(
             "div",
+            children=children,
             attrs=attrs,
             events=events,
             id=id,
@@ -25,13 +33,6 @@ class Card(Element):
         )
         self.attrs["class"] = ["card"]
 
-        if header:
-            self.children.append(CardHeader(header))
-        if body:
-            self.children.append(CardBody(body))
-        if footer:
-            self.children.append(CardFooter(footer))
-
 
 class CardHeader(Element):
     """A Bootstrap card header."""
@@ -20,8 +20,15 @@ class Carousel(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        children = [CarouselInner(items)]
+        if indicators and id:
+            children.append(CarouselIndicators(len(items), target=f"#{id}"))
+        if controls and id:
+            children.append(CarouselControl(direction="prev", target=f"#{id}"))
+            children.append(CarouselControl(direction="next", target=f"#{id}"))
         super().__init__(
             "div",
+            children=children,
             attrs=attrs,
             events=events,
             id=id,
@@ -29,7 +36,7 @@ class Carousel(Element):
         )
         self.attrs["class"] = ["carousel", "slide"]
         self.attrs["data-bs-ride"] = "carousel"  # Enable auto-cycling
-        self.attrs["data-bs-interval"] = interval
+        self.attrs["data-bs-interval"] = str(interval)
 
         if crossfade:
             self.attrs["class"].append("carousel-fade")
@@ -37,19 +44,6 @@ class Carousel(Element):
         if id:
             self.attrs["id"] = id
 
-        inner = CarouselInner(items)
-        self.children.append(inner)
-
-        if indicators and id:
-            indicators_element = CarouselIndicators(len(items), target=f"#{id}")
-            self.children.append(indicators_element)
-
-        if controls and id:
-            control_prev = CarouselControl(direction="prev", target=f"#{id}")
-            control_next = CarouselControl(direction="next", target=f"#{id}")
-            self.children.append(control_prev)
-            self.children.append(control_next)
-
 
 class CarouselInner(Element):
     """Inner container for carousel items."""
@@ -58,13 +52,12 @@ class CarouselInner(Element):
                  events: list[EventHandler] | EventHandler | None = None,
                  id: str | None = None,
                  hyperscript: str | None = None):
-        super().__init__("div", attrs=attrs, events=events, id=id, hyperscript=hyperscript)
-        self.attrs["class"] = ["carousel-inner"]
         for i, item in enumerate(items):
             item.attrs["class"].append("carousel-item")
             if i == 0:
                 item.attrs["class"].append("active")
-            self.children.append(item)
+        super().__init__("div", children=list(items), attrs=attrs, events=events, id=id, hyperscript=hyperscript)
+        self.attrs["class"] = ["carousel-inner"]
 
 
 class CarouselItem(Element):
@@ -85,15 +78,13 @@ class CarouselControl(Element):
                  events: list[EventHandler] | EventHandler | None = None,
                  id: str | None = None,
                  hyperscript: str | None = None):
-        super().__init__("button", attrs=attrs, events=events, id=id, hyperscript=hyperscript)
+        icon = Element("span", attrs={"class": f"carousel-control-{direction}-icon", "aria-hidden": "true"})
+        visually_hidden = Element("span", attrs={"class": "visually-hidden"}, children=direction)
+        super().__init__("button", children=[icon, visually_hidden], attrs=attrs, events=events, id=id, hyperscript=hyperscript)
         self.attrs["class"] = [f"carousel-control-{direction}"]
         self.attrs["type"] = "button"
         self.attrs["data-bs-target"] = target
         self.attrs["data-bs-slide"] = direction
-        icon = Element("span", attrs={"class": f"carousel-control-{direction}-icon", "aria-hidden": "true"})
-        visually_hidden = Element("span", attrs={"class": "visually-hidden"}, children=direction)
-        self.children.append(icon)
-        self.children.append(visually_hidden)
 
 
 class CarouselIndicators(Element):
@@ -103,8 +94,7 @@ class CarouselIndicators(Element):
                  events: list[EventHandler] | EventHandler | None = None,
                  id: str | None = None,
                  hyperscript: str | None = None):
-        super().__init__("div", attrs=attrs, events=events, id=id, hyperscript=hyperscript)
-        ol = Element("ol", attrs={"class": ["carousel-indicators"]})
+        buttons = []
         for i in range(count):
             li = Element("button", attrs={
                 "type": "button",
@@ -115,5 +105,6 @@ class CarouselIndicators(Element):
             if i == 0:
                 li.attrs["class"] = ["active"]
                 li.attrs["aria-current"] = "true"
-            ol.children.append(li)
-        self.children.append(ol)
+            buttons.append(li)
+        ol = Element("ol", children=buttons, attrs={"class": ["carousel-indicators"]})
+        super().__init__("div", children=[ol], attrs=attrs, events=events, id=id, hyperscript=hyperscript)
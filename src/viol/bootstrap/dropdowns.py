@@ -20,6 +20,7 @@ class Dropdown(Element):
     ):
         super().__init__(
             "div",
+            children=[DropdownToggle(toggle), DropdownMenu(menu)],
             attrs=attrs,
             events=events,
             id=id,
@@ -29,11 +30,6 @@ class Dropdown(Element):
         if direction:
             self.attrs["class"].append(f"drop{direction}")
 
-        toggle_element = DropdownToggle(toggle)
-        menu_element = DropdownMenu(menu)
-        self.children.append(toggle_element)
-        self.children.append(menu_element)
-
 
 class DropdownToggle(Element):
     """The toggle element for a Bootstrap dropdown."""
@@ -73,14 +69,13 @@ class DropdownMenu(Element):
     ):
         super().__init__(
             "ul",
+            children=[DropdownItem(item) for item in items],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["dropdown-menu"]
-        for item in items:
-            self.children.append(DropdownItem(item))
 
 
 class DropdownItem(Element):
@@ -94,12 +89,12 @@ class DropdownItem(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        item = Element("a", attrs={"class": ["dropdown-item"]}, children=content)
         super().__init__(
             "li",
+            children=[item],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
-        item = Element("a", attrs={"class": ["dropdown-item"]}, children=content)
-        self.children.append(item)
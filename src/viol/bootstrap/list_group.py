@@ -21,6 +21,7 @@ class ListGroup(Element):
     ):
         super().__init__(
             "ul",
+            children=[ListGroupItem(item) for item in items],
             attrs=attrs,
             events=events,
             id=id,
@@ -35,9 +36,6 @@ class ListGroup(Element):
             else:
                 self.attrs["class"].append("list-group-horizontal")
 
-        for item in items:
-            self.add_child(ListGroupItem(item))
-
 
 class ListGroupItem(Element):
     """An item in a Bootstrap list group."""
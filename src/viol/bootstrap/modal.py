@@ -22,17 +22,6 @@ class Modal(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
-        super().__init__(
-            "div",
-            attrs=attrs,
-            events=events,
-            id=id,
-            hyperscript=hyperscript,
-        )
-        self.attrs["class"] = ["modal", "fade"]
-        self.attrs["tabindex"] = "-1"
-        self.attrs["aria-hidden"] = "true"
-
         dialog_attrs = AttrMultiDict({"class": ["modal-dialog"]})
         if size:
             dialog_attrs["class"].append(f"modal-dialog-{size}")
@@ -44,7 +33,17 @@ class Modal(Element):
         modal_dialog = ModalDialog(
             title=title, body=body, footer=footer, attrs=dialog_attrs
         )
-        self.children.append(modal_dialog)
+        super().__init__(
+            "div",
+            children=[modal_dialog],
+            attrs=attrs,
+            events=events,
+            id=id,
+            hyperscript=hyperscript,
+        )
+        self.attrs["class"] = ["modal", "fade"]
+        self.attrs["tabindex"] = "-1"
+        self.attrs["aria-hidden"] = "true"
 
 
 class ModalDialog(Element):
@@ -62,14 +61,13 @@ class ModalDialog(Element):
     ):
         super().__init__(
             "div",
+            children=[ModalContent(title=title, body=body, footer=footer)],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["modal-dialog"]
-        content = ModalContent(title=title, body=body, footer=footer)
-        self.children.append(content)
 
 
 class ModalContent(Element):
@@ -85,20 +83,18 @@ class ModalContent(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        children = [ModalHeader(title), ModalBody(body)]
+        if footer:
+            children.append(ModalFooter(footer))
         super().__init__(
             "div",
+            children=children,
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["modal-content"]
-        header = ModalHeader(title)
-        body_element = ModalBody(body)
-        self.children.append(header)
-        self.children.append(body_element)
-        if footer:
-            self.children.append(ModalFooter(footer))
 
 
 class ModalHeader(Element):
@@ -112,20 +108,19 @@ class ModalHeader(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        title_element = Element("h5", attrs={"class": ["modal-title"]}, children=title)
+        close_button = CloseButton(
+            attrs={"data-bs-dismiss": "modal", "aria-label": "Close"}
+        )
         super().__init__(
             "div",
+            children=[title_element, close_button],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["modal-header"]
-        title_element = Element("h5", attrs={"class": ["modal-title"]}, children=title)
-        close_button = CloseButton(
-            attrs={"data-bs-dismiss": "modal", "aria-label": "Close"}
-        )
-        self.children.append(title_element)
-        self.children.append(close_button)
 
 
 class ModalBody(Element):
@@ -141,6 +136,7 @@ class ModalBody(Element):
     ):
         super().__init__(
             "div",
+            children=content,
             attrs=attrs,
             events=events,
             id=id,
@@ -162,6 +158,7 @@ class ModalFooter(Element):
     ):
         super().__init__(
             "div",
+            children=content,
             attrs=attrs,
             events=events,
             id=id,
@@ -21,6 +21,7 @@ class Nav(Element):
     ):
         super().__init__(
             "ul",
+            children=[NavItem(item) for item in items],
             attrs=attrs,
             events=events,
             id=id,
@@ -32,10 +33,6 @@ class Nav(Element):
         if fill:
             self.attrs["class"].append("nav-fill")
 
-        for item in items:
-            nav_item = NavItem(item)
-            self.children.append(nav_item)
-
 
 class NavItem(Element):
     """An item in a Bootstrap nav."""
@@ -50,19 +47,19 @@ class NavItem(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        link = Element("a", attrs={"class": ["nav-link"]}, children=content)
         super().__init__(
             "li",
+            children=[link],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["nav-item"]
-        link = Element("a", attrs={"class": ["nav-link"]}, children=content)
         if active:
             link.attrs["class"].append("active")
             link.attrs["aria-current"] = "page"
         if disabled:
             link.attrs["class"].append("disabled")
             link.attrs["aria-disabled"] = "true"
-        self.children.append(link)
@@ -22,8 +22,11 @@ class Offcanvas(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        header = OffcanvasHeader(title=title, offcanvas_id=id)
+        body_element = OffcanvasBody(body)
         super().__init__(
             "div",
+            children=[header, body_element],
             attrs=attrs,
             events=events,
             id=id,
@@ -41,11 +44,6 @@ class Offcanvas(Element):
         if not keyboard:
             self.attrs["data-bs-keyboard"] = "false"
 
-        header = OffcanvasHeader(title=title, offcanvas_id=id)
-        body_element = OffcanvasBody(body)
-        self.children.append(header)
-        self.children.append(body_element)
-
 
 class OffcanvasHeader(Element):
     """The header for a Bootstrap offcanvas."""
@@ -59,14 +57,6 @@ class OffcanvasHeader(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
-        super().__init__(
-            "div",
-            attrs=attrs,
-            events=events,
-            id=id,
-            hyperscript=hyperscript,
-        )
-        self.attrs["class"] = ["offcanvas-header"]
         title_element = Element(
             "h5",
             attrs={
@@ -78,8 +68,15 @@ class OffcanvasHeader(Element):
         close_button = CloseButton(
             attrs={"data-bs-dismiss": "offcanvas", "aria-label": "Close"}
         )
-        self.children.append(title_element)
-        self.children.append(close_button)
+        super().__init__(
+            "div",
+            children=[title_element, close_button],
+            attrs=attrs,
+            events=events,
+            id=id,
+            hyperscript=hyperscript,
+        )
+        self.attrs["class"] = ["offcanvas-header"]
 
 
 class OffcanvasBody(Element):
@@ -18,15 +18,20 @@ class Pagination(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        ol = Element(
+            "ul",
+            children=[PaginationItem(item) for item in items],
+            attrs={"class": ["pagination"]},
+        )
         super().__init__(
             "nav",
+            children=[ol],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["aria-label"] = "Page navigation"
-        ol = Element("ul", attrs={"class": ["pagination"]})
 
         if size:
             ol.attrs["class"].append(f"pagination-{size}")
@@ -37,10 +42,6 @@ class Pagination(Element):
         elif alignment == "end":
             ol.attrs["class"].append("justify-content-end")
 
-        for item in items:
-            ol.children.append(PaginationItem(item))
-        self.children.append(ol)
-
 
 class PaginationItem(Element):
     """An item in a Bootstrap pagination."""
@@ -55,18 +56,18 @@ class PaginationItem(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        link = Element("a", attrs={"class": ["page-link"]}, children=content)
         super().__init__(
             "li",
+            children=[link],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["page-item"]
-        link = Element("a", attrs={"class": ["page-link"]}, children=content)
         if active:
             self.attrs["class"].append("active")
             link.attrs["aria-current"] = "page"
         if disabled:
             self.attrs["class"].append("disabled")
-        self.children.append(link)
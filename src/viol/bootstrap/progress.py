@@ -33,8 +33,22 @@ class Progress(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        bar = Element("div", children=label, attrs={"class": ["progress-bar"]})
+        if value_max > value_min:
+            pct = (value_now - value_min) * 100 // (value_max - value_min)
+        else:
+            # empty range, nothing to fill
+            pct = 0
+        bar.attrs["style"] = f"width: {pct}%"
+        if color:
+            bar.attrs["class"].append(f"bg-{color}")
+        if striped:
+            bar.attrs["class"].append("progress-bar-striped")
+        if animated:
+            bar.attrs["class"].append("progress-bar-animated")
         super().__init__(
             "div",
+            children=[bar],
             attrs=attrs,
             events=events,
             id=id,
@@ -45,18 +59,5 @@ class Progress(Element):
         self.attrs["aria-valuenow"] = str(value_now)
         self.attrs["aria-valuemin"] = str(value_min)
         self.attrs["aria-valuemax"] = str(value_max)
-
-        bar = Element("div", attrs={"class": ["progress-bar"]})
-        bar.attrs["style"] = f"width: {value_now}%"
-        if color:
-            bar.attrs["class"].append(f"bg-{color}")
-        if striped:
-            bar.attrs["class"].append("progress-bar-striped")
-        if animated:
-            bar.attrs["class"].append("progress-bar-animated")
-        if label:
-            bar.children.append(label)
         if height:
             self.attrs["style"] = f"height: {height}"
-
-        self.children.append(bar)
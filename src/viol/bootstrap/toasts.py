@@ -21,6 +21,7 @@ class Toast(Element):
     ):
         super().__init__(
             "div",
+            children=[ToastHeader(title=header), ToastBody(content=body)],
             attrs=attrs,
             events=events,
             id=id,
@@ -40,9 +41,6 @@ class Toast(Element):
             self.attrs["data-bs-autohide"] = "false"
         self.attrs["data-bs-delay"] = str(delay)
 
-        self.children.append(ToastHeader(title=header))
-        self.children.append(ToastBody(content=body))
-
 
 class ToastHeader(Element):
     """The header for a Bootstrap toast."""
@@ -55,18 +53,18 @@ class ToastHeader(Element):
         id: str | None = None,
         hyperscript: str | None = None,
     ):
+        close_button = CloseButton(
+            attrs={"data-bs-dismiss": "toast", "aria-label": "Close"}
+        )
         super().__init__(
             "div",
+            children=[title, close_button],
             attrs=attrs,
             events=events,
             id=id,
             hyperscript=hyperscript,
         )
         self.attrs["class"] = ["toast-header"]
-        self.children.append(title)
-        self.children.append(
-            CloseButton(attrs={"data-bs-dismiss": "toast", "aria-label": "Close"})
-        )
 
 
 class ToastBody(Element):
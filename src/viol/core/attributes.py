@@ -85,7 +85,8 @@ class AttrMultiDict(MutableMapping[str, T]):
             if args[0] is None:
                 args = {}
         self._data = CIMultiDict()
-        self.update(dict(*args, **kwargs))
+        # copy straight into the multidict, no intermediate dict
+        self.update(*args, **kwargs)
 
     @overload
     def __getitem__(self, key: Literal["class"]) -> list[str]: ...
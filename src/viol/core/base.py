@@ -10,6 +10,7 @@ from contextvars import Context, ContextVar, copy_context
 from typing import Any, TypeGuard, TypeVar, Union
 
 from jinja2 import Template
+from markupsafe import Markup
 
 __all__ = [
     "Component",
@@ -62,12 +63,15 @@ class ContextDict(UserDict[str, Any]):
         return ListView(self, "parent")
 
     def __getitem__(self, key: str) -> Any:
-        try:
-            return super().__getitem__(key)
-        except KeyError:
-            if self.parent is not None:
-                return self.parent[key]
-            raise
+        # walk up the parents in a loop, a lookup from deep in the component
+        # tree shouldn't cost a Python frame per level
+        ctx = self
+        while ctx is not None:
+            try:
+                return ctx.data[key]
+            except KeyError:
+                ctx = ctx.parent
+        raise KeyError(key)
 
     def __delitem__(self, key: str) -> None:
         try:
@@ -88,6 +92,8 @@ class ContextDict(UserDict[str, Any]):
 
 
 class Component(abc.ABC):
+    __slots__ = ("__weakref__", "uuid")
+
     uuid: str
 
     def __new__(cls, *args, **kwargs):
@@ -146,6 +152,11 @@ def is_renderable(obj: Any) -> TypeGuard[RenderableType]:
     return False
 
 
+@functools.lru_cache(maxsize=1024)
+def compile_template(source: str) -> Template:
+    return Template(source)
+
+
 def render(r: RenderableType) -> str:
     # None
     if r is None:
@@ -155,10 +166,16 @@ def render(r: RenderableType) -> str:
         return r.render()
     if isinstance(r, Iterable) and not isinstance(r, str):
         # lists, tuples, sets, etc.
-        return " ".join(render(c) for c in r)
+        return " ".join([render(c) for c in r])
     # template to render
     if isinstance(r, str):
-        r: Template = Template(r)
+        if isinstance(r, Markup) or (
+            "{" not in r and "\r" not in r and not r.endswith("\n")
+        ):
+            # already rendered html, or plain text (most attribute values and
+            # labels) that jinja would hand back unchanged
+            return r
+        r: Template = compile_template(r)
     ctx = render_ctx.get()
     if ctx is None:
         return r.render()
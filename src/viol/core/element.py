@@ -13,6 +13,8 @@ __all__ = [
 
 
 class Element(Component):
+    __slots__ = ("attrs", "children", "events", "tag")
+
     def __init__(
         self,
         tag: str,
@@ -44,6 +46,8 @@ class Element(Component):
 
 
 class VoidElement(Element):
+    __slots__ = ()
+
     def __init__(
         self,
         tag: str,
@@ -1,23 +1,9 @@
 from pathlib import Path
 
 import jinja2
-import pandas as pd
 
 cwd = Path(__file__).parent
 
-df = pd.read_csv(cwd / "HTMLElements.csv", encoding="utf-8")
-
-df = df.assign(Attributes=df["Attributes"].str.split(";"))
-
-df = df.explode("Attributes", ignore_index=True)
-
-df = df.assign(
-    # 'h1, h2, h3, h4, h5, h6'
-    Element=df["Element"].str.split(",").apply(lambda x: list(map(str.strip, x)))
-)
-
-df = df.explode("Element", ignore_index=True)
-
 global_attrs = [
     "accesskey",
     "autocapitalize",
@@ -50,7 +36,7 @@ global_attrs = [
     "slot",
 ]
 
-text = """from __future__ import annotations
+TEMPLATE = """from __future__ import annotations
 
 from typing import Any, Generic, TypedDict, TypeVar
 
@@ -90,32 +76,52 @@ class ElementBuilder(Generic[A]):
 
 """
 
-elements = set()
 
-for element in df["Element"].unique():
-    if element == "MathML math":
-        elements.add("math")
-        text += """
+def main() -> None:
+    # pandas is only needed to regenerate the elements module, not at runtime
+    import pandas as pd  # noqa: PLC0415
+
+    text = TEMPLATE
+
+    df = pd.read_csv(cwd / "HTMLElements.csv", encoding="utf-8")
+
+    df = df.assign(Attributes=df["Attributes"].str.split(";"))
+
+    df = df.explode("Attributes", ignore_index=True)
+
+    df = df.assign(
+        # 'h1, h2, h3, h4, h5, h6'
+        Element=df["Element"].str.split(",").apply(lambda x: list(map(str.strip, x)))
+    )
+
+    df = df.explode("Element", ignore_index=True)
+
+    elements = set()
+
+    for element in df["Element"].unique():
+        if element == "MathML math":
+            elements.add("math")
+            text += """
 math = ElementBuilder(
     "math", dict
 )
 """
-    elif element == "SVG svg":
-        elements.add("svg")
-        text += """
+        elif element == "SVG svg":
+            elements.add("svg")
+            text += """
 svg = ElementBuilder(
     "svg", dict
 )
 """
-    else:
-        attrs: list = df[df["Element"] == element]["Attributes"].unique().tolist()
-        var = element if element != "del" else "del_"
-        elements.add(var)
-        if "globals" in attrs:
-            attrs.remove("globals")
-            attrs.extend(global_attrs)
-        attrs = list({s.strip() for s in attrs})
-        text += f"""
+        else:
+            attrs: list = df[df["Element"] == element]["Attributes"].unique().tolist()
+            var = element if element != "del" else "del_"
+            elements.add(var)
+            if "globals" in attrs:
+                attrs.remove("globals")
+                attrs.extend(global_attrs)
+            attrs = list({s.strip() for s in attrs})
+            text += f"""
 {var} = ElementBuilder(
     "{element}",
     TypedDict(
@@ -127,9 +133,13 @@ svg = ElementBuilder(
 )
 """
 
-env = jinja2.Environment()
-text = env.from_string(text).render(elements=elements)
+    env = jinja2.Environment()
+    text = env.from_string(text).render(elements=elements)
+
+    # write to file
+    with open(cwd / "elements.py", "w") as f:
+        f.write(text)
+
 
-# write to file
-with open(cwd / "elements.py", "w") as f:
-    f.write(text)
+if __name__ == "__main__":
+    main()
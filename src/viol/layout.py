@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from flask import Blueprint, Flask, url_for
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from viol.core import Component
 from viol.core.base import render
 
 fdir = Path(__file__).parent
 
+# shared environment so that compiled templates are cached across layouts
+env = Environment(loader=FileSystemLoader(fdir / "templates"))
+
+
+@functools.cache
+def get_template(name: str) -> Template:
+    # bundled templates do not change at runtime, skip jinja's uptodate check
+    return env.get_template(name)
+
 
 def init_app(
     app: Flask,
@@ -33,8 +43,8 @@ class BasicLayout(Component):
         extra_head_content: str | None = None,
         extra_body_content: str | None = None,
     ) -> None:
-        self.env = Environment(loader=FileSystemLoader(fdir / "templates"))
-        self.template = self.env.get_template("index.html")
+        self.env = env
+        self.template = get_template("index.html")
         self.title = title
         self.extra_head_content = extra_head_content
         self.body = body
@@ -0,0 +1,124 @@
+import pytest
+
+from viol import render
+from viol.bootstrap.accordion import Accordion
+from viol.bootstrap.card import Card
+from viol.bootstrap.carousel import Carousel, CarouselItem
+from viol.bootstrap.dropdowns import Dropdown
+from viol.bootstrap.list_group import ListGroup
+from viol.bootstrap.modal import Modal, ModalBody, ModalFooter
+from viol.bootstrap.navs_tabs import Nav, NavItem
+from viol.bootstrap.offcanvas import Offcanvas
+from viol.bootstrap.pagination import Pagination, PaginationItem
+from viol.bootstrap.progress import Progress
+from viol.bootstrap.toasts import Toast
+
+
+@pytest.mark.parametrize(
+    ("build", "expected"),
+    [
+        (
+            lambda: Card(header="h", body="b", footer="f"),
+            [
+                '<div class="card-header">h</div>',
+                '<div class="card-body">b</div>',
+                '<div class="card-footer">f</div>',
+            ],
+        ),
+        (Card, ['<div class="card"></div>']),
+        (
+            lambda: Carousel([CarouselItem("x"), CarouselItem("y")], id="c"),
+            ['data-bs-slide-to="1"', ">x</div>", ">y</div>", 'data-bs-slide="next"'],
+        ),
+        (
+            lambda: Dropdown("t", ["a", "b"], direction="up"),
+            ['<a class="dropdown-item">a</a>', '<a class="dropdown-item">b</a>'],
+        ),
+        (
+            lambda: ListGroup(["a", "b"], numbered=True),
+            ['<li class="list-group-item">a</li>', "list-group-numbered"],
+        ),
+        (
+            lambda: Modal("t", "b", footer="f", size="lg"),
+            [
+                '<h5 class="modal-title">t</h5>',
+                '<div class="modal-body">b</div>',
+                '<div class="modal-footer">f</div>',
+            ],
+        ),
+        (
+            lambda: Nav(["a", "b"], variant="pills"),
+            ['<li class="nav-item"><a class="nav-link">b</a></li>'],
+        ),
+        (lambda: NavItem("n", active=True), ['aria-current="page"', ">n</a>"]),
+        (
+            lambda: Offcanvas("t", "b", id="o"),
+            ['id="oLabel">t</h5>', '<div class="offcanvas-body">b</div>'],
+        ),
+        (
+            lambda: Pagination(["1", "2"], size="sm"),
+            ['<li class="page-item"><a class="page-link">2</a></li>'],
+        ),
+        (lambda: PaginationItem("3", active=True), ['aria-current="page">3</a>']),
+        (
+            lambda: Toast("h", "b"),
+            ['<div class="toast-header">h ', '<div class="toast-body">b</div>'],
+        ),
+    ],
+)
+def test_component_renders_children(build, expected):
+    out = render(build())
+    for fragment in expected:
+        assert fragment in out
+
+
+def test_modal_body_and_footer_keep_content():
+    assert render(ModalBody("mb")) == '<div class="modal-body">mb</div>'
+    assert render(ModalFooter("mf")) == '<div class="modal-footer">mf</div>'
+
+
+def test_carousel_accepts_int_interval():
+    out = render(Carousel([CarouselItem("x")], id="c", interval=3000))
+    assert 'data-bs-interval="3000"' in out
+
+
+def test_progress_renders_label_classes_and_width():
+    progress = Progress(
+        30, color="success", striped=True, animated=True, label="30%", height="4px"
+    )
+    out = render(progress)
+    assert out.startswith('<div class="progress" role="progressbar"')
+    assert 'aria-valuenow="30"' in out
+    assert 'style="height: 4px"' in out
+    bar = progress.children[0]
+    assert set(bar.attrs["class"]) == {
+        "progress-bar",
+        "bg-success",
+        "progress-bar-striped",
+        "progress-bar-animated",
+    }
+    assert 'style="width: 30%">30%</div>' in out
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "width"),
+    [
+        ({"value_now": 15, "value_min": 10, "value_max": 30}, "width: 25%"),
+        ({"value_now": 30, "value_min": 10, "value_max": 30}, "width: 100%"),
+        ({"value_now": 5, "value_min": 5, "value_max": 5}, "width: 0%"),
+        ({"value_now": 5, "value_min": 10, "value_max": 5}, "width: 0%"),
+    ],
+)
+def test_progress_width_uses_value_range(kwargs, width):
+    assert f'style="{width}"' in render(Progress(**kwargs))
+
+
+def test_accordion_flush_toggles_a_single_class():
+    accordion = Accordion(id="acc")
+    accordion.accordion_flush = True
+    accordion.accordion_flush = True
+    assert accordion.attrs["class"] == ["accordion", "accordion-flush"]
+    assert accordion.accordion_flush
+    accordion.accordion_flush = False
+    assert accordion.attrs["class"] == ["accordion"]
+    assert not accordion.accordion_flush
@@ -0,0 +1,47 @@
+import pytest
+from jinja2 import Template
+from markupsafe import Markup
+
+from viol import html, render
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "",
+        "plain text",
+        "<b>bold</b> &amp;",
+        "line\nbreak",
+        "{{ 1 + 1 }}",
+        "{% if true %}yes{% endif %}",
+        "{# comment #}kept",
+        "lone { brace",
+        "windows\r\nnewline",
+        "trailing newline\n",
+        "two trailing newlines\n\n",
+    ],
+)
+def test_render_string_matches_jinja(source):
+    assert render(source) == Template(source).render()
+
+
+def test_render_string_template():
+    assert render("{{ 1 + 1 }}") == "2"
+    assert render("a\r\nb") == "a\nb"
+    assert render("a\n") == "a"
+
+
+def test_render_markup_is_not_a_template():
+    markup = Markup("<p>{{ not a template }}</p>\n")
+    assert render(markup) == markup
+
+
+def test_render_none_and_iterables():
+    assert render(None) == ""
+    assert render(["a", "{{ 2 }}", Markup("<br>")]) == "a 2 <br>"
+
+
+def test_render_element_attrs_are_escaped():
+    out = render(html.a("x", attrs={"href": '/q?a=1&b="2"', "title": "{{ 3 }}"}))
+    assert 'href="/q?a=1&amp;b=&quot;2&quot;"' in out
+    assert 'title="3"' in out